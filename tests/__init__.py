@@ -0,0 +1,10 @@
+"""
+Test Package for the Product Service
+
+The service package builds its database engine when it is imported, so the
+default test database must be set before any test module imports it.
+Set DATABASE_URI to a postgresql:// URI to run the tests against Postgres.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")